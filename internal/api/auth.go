@@ -12,6 +12,14 @@ import (
 	"time"
 )
 
+const (
+	// websocketQuery is the query string appended to every WebSocket URL
+	websocketQuery = "since_id=0&stream_id=0"
+
+	// fallbackWebSocketURL is used when the login response lacks WebSocket details
+	fallbackWebSocketURL = "wss://www.irccloud.com/?" + websocketQuery
+)
+
 // authenticate authenticates with the IRCCloud API and returns the full authentication response.
 func (c *IRCCloudClient) authenticate(email, password string) (*AuthResponse, error) {
 	log.Printf("🔐 Starting authentication for email: %s", email)
@@ -20,73 +28,37 @@ func (c *IRCCloudClient) authenticate(email, password string) (*AuthResponse, er
 	if err != nil {
 		return nil, fmt.Errorf("failed to create cookie jar: %w", err)
 	}
-	client := &http.Client{Timeout: 10 * time.Second, Jar: jar}
+	// Share the client's connection pool so the token, login and backlog
+	// requests reuse keep-alive connections instead of new TLS handshakes
+	client := &http.Client{Timeout: 10 * time.Second, Jar: jar, Transport: c.httpClient.Transport}
 
 	// Step 1: Get an auth-formtoken
 	log.Println("📡 Step 1: Requesting auth-formtoken...")
-	tokenURL := "https://www.irccloud.com/chat/auth-formtoken"
-	req, err := http.NewRequest("POST", tokenURL, http.NoBody)
-	if err != nil {
-		return nil, fmt.Errorf("could not create token request: %w", err)
-	}
-	req.Header.Set("User-Agent", "irccloud-watcher/0.1.0")
-	req.Header.Set("Accept", "application/json")
-	req.Header.Set("Content-Length", "0")
-
-	debugLogRequest("POST", tokenURL, req.Header)
-	resp, err := client.Do(req)
+	tokenResp, err := requestFormToken(client, irccloudBaseURL+"/chat/auth-formtoken")
 	if err != nil {
-		return nil, fmt.Errorf("could not perform token request: %w", err)
-	}
-	defer resp.Body.Close()
-
-	log.Printf("📡 Token request response status: %s", resp.Status)
-	if resp.StatusCode != http.StatusOK {
-		errorBody, readErr := io.ReadAll(resp.Body)
-		if readErr == nil {
-			log.Printf("❌ Token request error response body: %s", string(errorBody))
-		}
-		return nil, fmt.Errorf("token request failed with status: %s", resp.Status)
-	}
-
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, fmt.Errorf("could not read token response body: %w", err)
-	}
-
-	debugLogResponse(resp, body)
-
-	var tokenResp TokenResponse
-	if parseErr := json.Unmarshal(body, &tokenResp); parseErr != nil {
-		log.Printf("❌ Failed to parse token response: %s", string(body))
-		return nil, fmt.Errorf("could not parse token response: %w", parseErr)
-	}
-
-	log.Printf("✅ Token received successfully: %t, Token length: %d", tokenResp.Success, len(tokenResp.Token))
-	if !tokenResp.Success {
-		return nil, fmt.Errorf("token request unsuccessful")
+		return nil, err
 	}
 
 	// Step 2: Log in with email, password, and token
 	log.Println("🔑 Step 2: Logging in with credentials...")
-	loginURL := "https://www.irccloud.com/chat/login"
+	loginURL := irccloudBaseURL + "/chat/login"
 	data := url.Values{}
 	data.Set("email", email)
 	data.Set("password", password)
 	data.Set("token", tokenResp.Token)
 
-	req, err = http.NewRequest("POST", loginURL, bytes.NewBufferString(data.Encode()))
+	req, err := http.NewRequest("POST", loginURL, bytes.NewBufferString(data.Encode()))
 	if err != nil {
 		return nil, fmt.Errorf("could not create login request: %w", err)
 	}
 
 	req.Header.Set("X-Auth-Formtoken", tokenResp.Token)
 	req.Header.Set("Content-Type", "application/x-www-form-urlencoded")
-	req.Header.Set("User-Agent", "irccloud-watcher/0.1.0")
+	req.Header.Set("User-Agent", userAgent)
 	req.Header.Set("Accept", "application/json")
 
 	debugLogRequest("POST", loginURL, req.Header)
-	resp, err = client.Do(req)
+	resp, err := client.Do(req)
 	if err != nil {
 		return nil, fmt.Errorf("could not perform login request: %w", err)
 	}
@@ -96,12 +68,12 @@ func (c *IRCCloudClient) authenticate(email, password string) (*AuthResponse, er
 	if resp.StatusCode != http.StatusOK {
 		errorBody, readErr := io.ReadAll(resp.Body)
 		if readErr == nil {
-			log.Printf("❌ Login request error response body: %s", string(errorBody))
+			log.Printf("❌ Login request error response body: %s", errorBody)
 		}
 		return nil, fmt.Errorf("login failed with status: %s", resp.Status)
 	}
 
-	body, err = io.ReadAll(resp.Body)
+	body, err := io.ReadAll(resp.Body)
 	if err != nil {
 		return nil, fmt.Errorf("could not read login response body: %w", err)
 	}
@@ -120,26 +92,79 @@ func (c *IRCCloudClient) authenticate(email, password string) (*AuthResponse, er
 	return authResp, nil
 }
 
+// requestFormToken fetches an auth-formtoken with an empty POST. The body is
+// http.NoBody, for which net/http itself writes "Content-Length: 0".
+func requestFormToken(client *http.Client, tokenURL string) (*TokenResponse, error) {
+	req, err := http.NewRequest("POST", tokenURL, http.NoBody)
+	if err != nil {
+		return nil, fmt.Errorf("could not create token request: %w", err)
+	}
+	req.Header.Set("User-Agent", userAgent)
+	req.Header.Set("Accept", "application/json")
+
+	debugLogRequest("POST", tokenURL, req.Header)
+	resp, err := client.Do(req)
+	if err != nil {
+		return nil, fmt.Errorf("could not perform token request: %w", err)
+	}
+	defer resp.Body.Close()
+
+	log.Printf("📡 Token request response status: %s", resp.Status)
+	if resp.StatusCode != http.StatusOK {
+		errorBody, readErr := io.ReadAll(resp.Body)
+		if readErr == nil {
+			log.Printf("❌ Token request error response body: %s", errorBody)
+		}
+		return nil, fmt.Errorf("token request failed with status: %s", resp.Status)
+	}
+
+	body, err := io.ReadAll(resp.Body)
+	if err != nil {
+		return nil, fmt.Errorf("could not read token response body: %w", err)
+	}
+
+	debugLogResponse(resp, body)
+
+	var tokenResp TokenResponse
+	if parseErr := json.Unmarshal(body, &tokenResp); parseErr != nil {
+		log.Printf("❌ Failed to parse token response: %s", body)
+		return nil, fmt.Errorf("could not parse token response: %w", parseErr)
+	}
+
+	log.Printf("✅ Token received successfully: %t, Token length: %d", tokenResp.Success, len(tokenResp.Token))
+	if !tokenResp.Success {
+		return nil, fmt.Errorf("token request unsuccessful")
+	}
+
+	return &tokenResp, nil
+}
+
 // buildWebSocketURL constructs the WebSocket URL from authentication response
 func (c *IRCCloudClient) buildWebSocketURL(authResp *AuthResponse) string {
 	if authResp.WebSocketHost != "" && authResp.WebSocketPath != "" {
-		baseURL := fmt.Sprintf("wss://%s%s", authResp.WebSocketHost, authResp.WebSocketPath)
-		// Add query parameters
-		u, err := url.Parse(baseURL)
+		// Parse only the path so its escapes and any query it carries survive,
+		// then fill in the rest instead of formatting and re-parsing a full URL
+		u, err := url.Parse(authResp.WebSocketPath)
 		if err != nil {
-			log.Printf("⚠️ Error parsing WebSocket URL, using fallback: %v", err)
-			return "wss://www.irccloud.com/?since_id=0&stream_id=0"
+			log.Printf("⚠️ Error parsing WebSocket path, using fallback: %v", err)
+			return fallbackWebSocketURL
+		}
+		u.Scheme = "wss"
+		u.Host = authResp.WebSocketHost
+		if u.RawQuery == "" {
+			u.RawQuery = websocketQuery
+		} else {
+			q := u.Query()
+			q.Set("since_id", "0")
+			q.Set("stream_id", "0")
+			u.RawQuery = q.Encode()
 		}
-		q := u.Query()
-		q.Set("since_id", "0")
-		q.Set("stream_id", "0")
-		u.RawQuery = q.Encode()
 		return u.String()
 	}
 
 	// Fallback to original URL
 	log.Println("⚠️ Using fallback WebSocket URL")
-	return "wss://www.irccloud.com/?since_id=0&stream_id=0"
+	return fallbackWebSocketURL
 }
 
 // parseAPIResponse parses API responses and handles errors properly
@@ -149,19 +174,16 @@ func parseAPIResponse(body []byte, statusCode int) (*AuthResponse, error) {
 		return nil, fmt.Errorf("could not parse response: %w", err)
 	}
 
+	// The error message is decoded along with the rest of the response, so
+	// failures don't need a second pass over the body
 	if !authResp.Success {
-		var errResp ErrorResponse
-		if err := json.Unmarshal(body, &errResp); err != nil {
-			// If we can't parse the error response, use a generic message
-			return nil, &AuthError{
-				Type:    "api_error",
-				Message: "Authentication failed",
-				Status:  statusCode,
-			}
+		message := authResp.Message
+		if message == "" {
+			message = "Authentication failed"
 		}
 		return nil, &AuthError{
 			Type:    "api_error",
-			Message: errResp.Message,
+			Message: message,
 			Status:  statusCode,
 		}
 	}
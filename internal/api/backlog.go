@@ -2,6 +2,7 @@ package api
 
 import (
 	"compress/gzip"
+	"context"
 	"encoding/json"
 	"fmt"
 	"io"
@@ -15,45 +16,88 @@ import (
 	"irccloud-watcher/internal/utils"
 )
 
-func (c *IRCCloudClient) processBacklog(backlogURL string) error {
+// startBacklog fetches a backlog in the background so the read loop keeps
+// draining live messages instead of blocking on the HTTP download. A newer
+// oob_include, e.g. after a reconnect, cancels a fetch that is still running.
+func (c *IRCCloudClient) startBacklog(backlogURL string) {
+	c.backlogMutex.Lock()
+	defer c.backlogMutex.Unlock()
+
+	// Close has started, don't start work it won't wait for
+	if c.ctx.Err() != nil {
+		return
+	}
+
+	if c.backlogCancel != nil {
+		c.backlogCancel()
+	}
+	ctx, cancel := context.WithCancel(c.ctx)
+	c.backlogCancel = cancel
+
+	session, apiHost := c.getSession()
+
+	c.backlogWG.Add(1)
+	go func() {
+		defer c.backlogWG.Done()
+		defer cancel()
+		if err := c.processBacklog(ctx, backlogURL, session, apiHost); err != nil {
+			log.Printf("⚠️ Error processing backlog: %v", err)
+		}
+	}()
+}
+
+// processBacklog downloads a backlog and stores its messages
+func (c *IRCCloudClient) processBacklog(ctx context.Context, backlogURL, session, apiHost string) error {
 	// The backlog URL is just a path, we need to prepend the correct API host
 	if !strings.HasPrefix(backlogURL, "http") {
-		if c.apiHost != "" {
+		if apiHost != "" {
 			// APIHost already includes the protocol (https://)
-			backlogURL = c.apiHost + backlogURL
+			backlogURL = apiHost + backlogURL
 		} else {
 			// Fallback to www.irccloud.com if no API host is available
-			backlogURL = "https://www.irccloud.com" + backlogURL
+			backlogURL = irccloudBaseURL + backlogURL
 		}
 	}
 
 	log.Printf("🔍 Requesting backlog from URL: %s", backlogURL)
 
-	req, err := http.NewRequest("GET", backlogURL, http.NoBody)
+	// Messages are stored while the body is decoded, so a large backlog can
+	// outlast any fixed deadline. Only waiting for the response and each read
+	// of the body are bounded by backlogTimeout.
+	ctx, cancel := context.WithCancel(ctx)
+	defer cancel()
+
+	req, err := http.NewRequestWithContext(ctx, "GET", backlogURL, http.NoBody)
 	if err != nil {
 		return fmt.Errorf("could not create backlog request: %w", err)
 	}
 
-	req.Header.Set("User-Agent", "irccloud-watcher/0.1.0")
-	req.Header.Set("Cookie", "session="+c.session)
+	req.Header.Set("User-Agent", userAgent)
+	req.Header.Set("Cookie", "session="+session)
 	req.Header.Set("Accept-Encoding", "gzip")
 
-	client := &http.Client{Timeout: 60 * time.Second}
-	resp, err := client.Do(req)
+	responseTimer := time.AfterFunc(c.backlogTimeout, cancel)
+	resp, err := c.httpClient.Do(req)
+	responseTimer.Stop()
 	if err != nil {
 		return fmt.Errorf("could not perform backlog request: %w", err)
 	}
-	defer resp.Body.Close()
+	defer func() {
+		// Drain a short remainder so the connection can be reused; past that
+		// limit dropping the connection is cheaper than downloading the rest
+		_, _ = io.CopyN(io.Discard, resp.Body, 64<<10)
+		resp.Body.Close()
+	}()
 
 	if resp.StatusCode != http.StatusOK {
 		return fmt.Errorf("backlog request failed with status: %s", resp.Status)
 	}
 
-	var reader io.Reader = resp.Body
+	var reader io.Reader = &stallReader{r: resp.Body, timeout: c.backlogTimeout, cancel: cancel}
 
 	// Check if the response is gzipped
 	if resp.Header.Get("Content-Encoding") == "gzip" {
-		gzipReader, err := gzip.NewReader(resp.Body)
+		gzipReader, err := gzip.NewReader(reader)
 		if err != nil {
 			return fmt.Errorf("could not create gzip reader: %w", err)
 		}
@@ -61,25 +105,29 @@ func (c *IRCCloudClient) processBacklog(backlogURL string) error {
 		reader = gzipReader
 	}
 
-	var backlogMessages []IRCMessage
+	// Decode the backlog array one element at a time so memory use is bounded
+	// by a single message instead of the whole backlog
 	decoder := json.NewDecoder(reader)
-	if err := decoder.Decode(&backlogMessages); err != nil {
-		return fmt.Errorf("could not decode backlog messages: %w", err)
+	tok, tokErr := decoder.Token()
+	if tokErr != nil {
+		return fmt.Errorf("could not decode backlog messages: %w", tokErr)
+	}
+	if delim, ok := tok.(json.Delim); !ok || delim != '[' {
+		return fmt.Errorf("could not decode backlog messages: expected JSON array, got %v", tok)
 	}
 
-	log.Printf("Processing %d backlog messages", len(backlogMessages))
+	log.Println("Processing backlog messages")
 
-	for _, ircMsg := range backlogMessages {
-		// Skip message if ignored or not in allowed channels
-		if ircMsg.Type != "buffer_msg" || c.ignoredChannelSet[ircMsg.Chan] || (len(c.channels) > 0 && !c.channelSet[ircMsg.Chan]) {
-			continue
+	count := 0
+	for decoder.More() {
+		var ircMsg IRCMessage
+		if decodeErr := decoder.Decode(&ircMsg); decodeErr != nil {
+			return fmt.Errorf("could not decode backlog message %d: %w", count, decodeErr)
 		}
+		count++
 
-		// Check if we've seen this EID before (skip if duplicate)
-		if c.isEIDSeen(ircMsg.EID) {
-			if os.Getenv("IRCCLOUD_DEBUG") == "true" {
-				log.Printf("🔄 Duplicate backlog message filtered: EID=%d, Channel=%s", ircMsg.EID, ircMsg.Chan)
-			}
+		// Skip message if ignored or not in allowed channels
+		if ircMsg.Type != "buffer_msg" || c.ignoredChannelSet[ircMsg.Chan] || (len(c.channels) > 0 && !c.channelSet[ircMsg.Chan]) {
 			continue
 		}
 
@@ -102,8 +150,6 @@ func (c *IRCCloudClient) processBacklog(backlogURL string) error {
 			log.Printf("🔍 Processing backlog message: Channel=%s, From=%s, EID=%d, Time=%d, Converted=%s", ircMsg.Chan, ircMsg.From, ircMsg.EID, ircMsg.Time, msgTime.Format(time.RFC3339))
 		}
 
-		log.Printf("%s <%s> %s", ircMsg.Chan, ircMsg.From, cleanedMsg)
-
 		dbMsg := &storage.Message{
 			Channel:   ircMsg.Chan,
 			Timestamp: msgTime,
@@ -113,13 +159,43 @@ func (c *IRCCloudClient) processBacklog(backlogURL string) error {
 			EID:       ircMsg.EID,
 		}
 
-		if err := c.db.InsertMessage(dbMsg); err != nil {
-			log.Printf("❌ Error inserting backlog message into DB: %v", err)
-		} else if os.Getenv("IRCCLOUD_DEBUG") == "true" {
-			log.Printf("✅ Backlog message stored successfully: EID=%d", ircMsg.EID)
+		// Skip duplicates; the EID is only remembered once the insert succeeds
+		stored, storeErr := c.storeMessage(dbMsg)
+		switch {
+		case storeErr != nil:
+			log.Printf("❌ Error inserting backlog message into DB: %v", storeErr)
+		case !stored:
+			if os.Getenv("IRCCLOUD_DEBUG") == "true" {
+				log.Printf("🔄 Duplicate backlog message filtered: EID=%d, Channel=%s", ircMsg.EID, ircMsg.Chan)
+			}
+		default:
+			log.Printf("%s <%s> %s", ircMsg.Chan, ircMsg.From, cleanedMsg)
+			if os.Getenv("IRCCLOUD_DEBUG") == "true" {
+				log.Printf("✅ Backlog message stored successfully: EID=%d", ircMsg.EID)
+			}
 		}
 	}
 
-	log.Println("Finished processing backlog")
+	// More also stops on a read error, so consume the closing bracket to tell
+	// a complete backlog from a truncated one
+	if _, endErr := decoder.Token(); endErr != nil {
+		return fmt.Errorf("could not decode backlog messages after %d: %w", count, endErr)
+	}
+
+	log.Printf("Finished processing %d backlog messages", count)
 	return nil
 }
+
+// stallReader cancels the request when a single Read blocks for longer than
+// timeout. Time spent between reads, e.g. storing messages, doesn't count.
+type stallReader struct {
+	r       io.Reader
+	timeout time.Duration
+	cancel  context.CancelFunc
+}
+
+func (s *stallReader) Read(p []byte) (int, error) {
+	timer := time.AfterFunc(s.timeout, s.cancel)
+	defer timer.Stop()
+	return s.r.Read(p)
+}
@@ -2,8 +2,10 @@ package api
 
 import (
 	"context"
+	"crypto/tls"
 	"fmt"
 	"log"
+	"net/http"
 	"os"
 	"sync"
 	"time"
@@ -14,6 +16,15 @@ import (
 	"github.com/gorilla/websocket"
 )
 
+const (
+	// userAgent is sent with every HTTP and WebSocket request
+	userAgent = "irccloud-watcher/0.1.0"
+
+	// irccloudBaseURL is the web origin used for authentication and as the
+	// fallback host for backlog requests
+	irccloudBaseURL = "https://www.irccloud.com"
+)
+
 // ConnectionState represents the current state of the WebSocket connection
 type ConnectionState int
 
@@ -47,8 +58,6 @@ type IRCCloudClient struct {
 	conn              *websocket.Conn
 	db                *storage.DB
 	lastSeenEID       int64
-	session           string
-	apiHost           string
 	channels          []string
 	ignoredChannels   []string
 	channelSet        map[string]bool
@@ -56,6 +65,7 @@ type IRCCloudClient struct {
 
 	// Connection management
 	connConfig      *config.ConnectionConfig
+	wsDialer        *websocket.Dialer
 	state           ConnectionState
 	stateMutex      sync.RWMutex
 	retryCount      int
@@ -63,6 +73,22 @@ type IRCCloudClient struct {
 	ctx             context.Context
 	cancelFunc      context.CancelFunc
 
+	// HTTP client reused across requests so keep-alive connections are pooled
+	httpClient *http.Client
+
+	// How long a backlog request may wait for its response or a body read
+	backlogTimeout time.Duration
+
+	// TLS session cache shared by HTTP requests and WebSocket dials so that
+	// reconnects resume sessions instead of doing a full handshake
+	tlsSessionCache tls.ClientSessionCache
+
+	// Session used for backlog requests, rewritten on reconnect while a
+	// reader goroutine may still be handling an oob_include
+	session      string
+	apiHost      string
+	sessionMutex sync.RWMutex
+
 	// Authentication cache
 	authResp *AuthResponse
 	email    string
@@ -72,9 +98,17 @@ type IRCCloudClient struct {
 	debugMode bool
 
 	// EID deduplication cache
-	eidCache      map[int64]bool
+	eidCache      map[int64]struct{}
 	eidCacheMutex sync.RWMutex
 	maxCacheSize  int
+
+	// Serializes the dedup check and insert so SQLite only ever sees one writer
+	storeMutex sync.Mutex
+
+	// Background backlog fetch state
+	backlogMutex  sync.Mutex
+	backlogCancel context.CancelFunc
+	backlogWG     sync.WaitGroup
 }
 
 // AuthResponse is the response from the IRCCloud authentication endpoint.
@@ -86,12 +120,7 @@ type AuthResponse struct {
 	WebSocketHost string `json:"websocket_host"`
 	WebSocketPath string `json:"websocket_path"`
 	URL           string `json:"url"`
-}
-
-// ErrorResponse represents an API error response.
-type ErrorResponse struct {
-	Success bool   `json:"success"`
-	Message string `json:"message"`
+	Message       string `json:"message"` // Error message when Success is false
 }
 
 // AuthError represents authentication-related errors.
@@ -119,11 +148,7 @@ type IRCMessage struct {
 	Hostmask string         `json:"hostmask"`
 	Ops      map[string]any `json:"ops"`
 	Self     bool           `json:"self"`
-}
-
-// OOBInclude is a message that contains a URL to the backlog.
-type OOBInclude struct {
-	URL string `json:"url"`
+	URL      string         `json:"url"` // Backlog URL on oob_include messages
 }
 
 // TokenResponse is the response from the auth-formtoken endpoint.
@@ -135,16 +160,29 @@ type TokenResponse struct {
 // NewIRCCloudClient creates a new IRCCloudClient.
 func NewIRCCloudClient(db *storage.DB) *IRCCloudClient {
 	ctx, cancel := context.WithCancel(context.Background())
+	sessionCache := tls.NewLRUClientSessionCache(32)
 	return &IRCCloudClient{
-		db:           db,
-		state:        StateDisconnected,
-		ctx:          ctx,
-		cancelFunc:   cancel,
-		eidCache:     make(map[int64]bool),
-		maxCacheSize: 10000, // Keep track of last 10k EIDs
+		db:              db,
+		httpClient:      newHTTPClient(sessionCache),
+		backlogTimeout:  60 * time.Second,
+		tlsSessionCache: sessionCache,
+		state:           StateDisconnected,
+		ctx:             ctx,
+		cancelFunc:      cancel,
+		eidCache:        make(map[int64]struct{}),
+		maxCacheSize:    10000, // Keep track of last 10k EIDs
 	}
 }
 
+// newHTTPClient returns an HTTP client with its own connection pool so that
+// repeated requests to the same IRCCloud host reuse keep-alive connections.
+func newHTTPClient(sessionCache tls.ClientSessionCache) *http.Client {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConnsPerHost = 4
+	transport.TLSClientConfig = &tls.Config{ClientSessionCache: sessionCache}
+	return &http.Client{Transport: transport}
+}
+
 // setState safely updates the connection state
 func (c *IRCCloudClient) setState(state ConnectionState) {
 	c.stateMutex.Lock()
@@ -162,6 +200,21 @@ func (c *IRCCloudClient) getState() ConnectionState {
 	return c.state
 }
 
+// setSession safely updates the session used for backlog requests
+func (c *IRCCloudClient) setSession(session, apiHost string) {
+	c.sessionMutex.Lock()
+	defer c.sessionMutex.Unlock()
+	c.session = session
+	c.apiHost = apiHost
+}
+
+// getSession safely reads the session used for backlog requests
+func (c *IRCCloudClient) getSession() (session, apiHost string) {
+	c.sessionMutex.RLock()
+	defer c.sessionMutex.RUnlock()
+	return c.session, c.apiHost
+}
+
 // SetConnectionConfig sets the connection configuration
 func (c *IRCCloudClient) SetConnectionConfig(cfg *config.ConnectionConfig) {
 	c.connConfig = cfg
@@ -177,13 +230,14 @@ func (c *IRCCloudClient) isEIDSeen(eid int64) bool {
 	c.eidCacheMutex.Lock()
 	defer c.eidCacheMutex.Unlock()
 
-	if c.eidCache[eid] {
+	// Insert unconditionally and detect duplicates by the unchanged size, so
+	// each EID is hashed once instead of for a lookup and then an insert
+	before := len(c.eidCache)
+	c.eidCache[eid] = struct{}{}
+	if len(c.eidCache) == before {
 		return true
 	}
 
-	// Add to cache
-	c.eidCache[eid] = true
-
 	// If cache is getting too large, clean it up (simple FIFO-ish cleanup)
 	if len(c.eidCache) > c.maxCacheSize {
 		// Remove roughly 20% of entries to avoid frequent cleanups
@@ -203,3 +257,29 @@ func (c *IRCCloudClient) isEIDSeen(eid int64) bool {
 
 	return false
 }
+
+// forgetEID removes an EID from the dedup cache so the message can be retried
+func (c *IRCCloudClient) forgetEID(eid int64) {
+	c.eidCacheMutex.Lock()
+	defer c.eidCacheMutex.Unlock()
+	delete(c.eidCache, eid)
+}
+
+// storeMessage inserts a message unless its EID has already been stored.
+// Live and backlog messages arrive on different goroutines; inserts are
+// serialized here, and an EID stays marked as seen only once its row exists.
+func (c *IRCCloudClient) storeMessage(msg *storage.Message) (bool, error) {
+	c.storeMutex.Lock()
+	defer c.storeMutex.Unlock()
+
+	if c.isEIDSeen(msg.EID) {
+		return false, nil
+	}
+
+	if err := c.db.InsertMessage(msg); err != nil {
+		c.forgetEID(msg.EID)
+		return false, err
+	}
+
+	return true, nil
+}
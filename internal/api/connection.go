@@ -1,10 +1,12 @@
 package api
 
 import (
+	"crypto/tls"
 	"fmt"
 	"io"
 	"log"
 	"math"
+	"net"
 	"net/http"
 	"time"
 
@@ -74,8 +76,7 @@ func (c *IRCCloudClient) attemptConnection() error {
 			return fmt.Errorf("authentication failed: %w", err)
 		}
 		c.authResp = authResp
-		c.session = authResp.Session
-		c.apiHost = authResp.APIHost
+		c.setSession(authResp.Session, authResp.APIHost)
 	}
 
 	// Step 2: Connect to the WebSocket API
@@ -84,32 +85,21 @@ func (c *IRCCloudClient) attemptConnection() error {
 	log.Printf("🌐 WebSocket URL: %s", wsURL)
 
 	header := http.Header{}
-	header.Add("Origin", "https://www.irccloud.com")
-	header.Add("User-Agent", "irccloud-watcher/0.1.0")
+	header.Add("Origin", irccloudBaseURL)
+	header.Add("User-Agent", userAgent)
 	header.Add("Cookie", "session="+c.authResp.Session)
 
-	// Parse connection timeout
-	timeout, err := time.ParseDuration(c.connConfig.ConnectionTimeout)
-	if err != nil {
-		timeout = 45 * time.Second
-	}
-
-	dialer := &websocket.Dialer{
-		Proxy:             http.ProxyFromEnvironment,
-		HandshakeTimeout:  timeout,
-		EnableCompression: true,
-	}
-
-	conn, resp, err := dialer.Dial(wsURL, header)
+	conn, resp, err := c.webSocketDialer().DialContext(c.ctx, wsURL, header)
 	if err != nil {
 		if resp != nil {
 			log.Printf("❌ WebSocket handshake failed with status: %s", resp.Status)
 			if location := resp.Header.Get("Location"); location != "" {
 				log.Printf("❌ Redirect location: %s", location)
 			}
-			errorBody, readErr := io.ReadAll(resp.Body)
+			// Only short bodies are logged, so don't read past that limit
+			errorBody, readErr := io.ReadAll(io.LimitReader(resp.Body, 500))
 			if readErr == nil && len(errorBody) < 500 {
-				log.Printf("❌ WebSocket response body: %s", string(errorBody))
+				log.Printf("❌ WebSocket response body: %s", errorBody)
 			}
 		}
 		return fmt.Errorf("websocket dial failed: %w", err)
@@ -124,6 +114,34 @@ func (c *IRCCloudClient) attemptConnection() error {
 	return nil
 }
 
+// webSocketDialer returns the dialer shared by all connection attempts, creating
+// it on first use. Go's TCP connections already disable Nagle's algorithm.
+func (c *IRCCloudClient) webSocketDialer() *websocket.Dialer {
+	if c.wsDialer != nil {
+		return c.wsDialer
+	}
+
+	// Parse connection timeout
+	timeout, err := time.ParseDuration(c.connConfig.ConnectionTimeout)
+	if err != nil {
+		timeout = 45 * time.Second
+	}
+
+	netDialer := &net.Dialer{
+		Timeout:   timeout,
+		KeepAlive: 30 * time.Second,
+	}
+
+	c.wsDialer = &websocket.Dialer{
+		NetDialContext:    netDialer.DialContext,
+		Proxy:             http.ProxyFromEnvironment,
+		TLSClientConfig:   &tls.Config{ClientSessionCache: c.tlsSessionCache},
+		HandshakeTimeout:  timeout,
+		EnableCompression: true,
+	}
+	return c.wsDialer
+}
+
 // calculateBackoffDelay calculates the delay for exponential backoff
 func (c *IRCCloudClient) calculateBackoffDelay() time.Duration {
 	initialDelay, err := time.ParseDuration(c.connConfig.InitialRetryDelay)
@@ -148,7 +166,14 @@ func (c *IRCCloudClient) calculateBackoffDelay() time.Duration {
 // Close closes the WebSocket connection and cancels reconnection attempts.
 func (c *IRCCloudClient) Close() {
 	c.setState(StateDisconnected)
-	c.cancelFunc() // Cancel any ongoing operations
+
+	// Cancel any ongoing operations and wait for a running backlog fetch so
+	// nothing writes to the DB after Close. Holding backlogMutex keeps
+	// startBacklog from adding to the WaitGroup while we wait on it.
+	c.backlogMutex.Lock()
+	c.cancelFunc()
+	c.backlogWG.Wait()
+	c.backlogMutex.Unlock()
 
 	if c.conn != nil {
 		if err := c.conn.WriteMessage(websocket.CloseMessage, websocket.FormatCloseMessage(websocket.CloseNormalClosure, "")); err != nil {
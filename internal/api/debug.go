@@ -24,20 +24,21 @@ func debugLogResponse(resp *http.Response, body []byte) {
 	if os.Getenv("IRCCLOUD_DEBUG") == "true" {
 		log.Printf("🔍 Response: %s", resp.Status)
 		if len(body) > 200 {
-			log.Printf("🔍 Body: %s...", string(body[:200]))
+			log.Printf("🔍 Body: %s...", body[:200])
 		} else {
-			log.Printf("🔍 Body: %s", string(body))
+			log.Printf("🔍 Body: %s", body)
 		}
 	}
 }
 
+// sensitiveHeaders holds the canonical names of headers never written to the debug log
+var sensitiveHeaders = map[string]bool{
+	"Authorization":    true,
+	"Cookie":           true,
+	"X-Auth-Formtoken": true,
+}
+
 // isSensitiveHeader checks if a header contains sensitive information
 func isSensitiveHeader(key string) bool {
-	sensitive := []string{"authorization", "cookie", "x-auth-formtoken"}
-	for _, s := range sensitive {
-		if strings.EqualFold(key, s) {
-			return true
-		}
-	}
-	return false
+	return sensitiveHeaders[http.CanonicalHeaderKey(key)]
 }
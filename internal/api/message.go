@@ -145,7 +145,7 @@ func (c *IRCCloudClient) runMessageLoop() error {
 func (c *IRCCloudClient) processMessage(message []byte) error {
 	// Print raw message if debug mode is enabled
 	if c.debugMode {
-		fmt.Printf("RAW: %s\n", string(message))
+		fmt.Printf("RAW: %s\n", message)
 	}
 
 	var ircMsg IRCMessage
@@ -154,27 +154,13 @@ func (c *IRCCloudClient) processMessage(message []byte) error {
 	}
 
 	if ircMsg.Type == "oob_include" {
-		var oob OOBInclude
-		if err := json.Unmarshal(message, &oob); err != nil {
-			return fmt.Errorf("unmarshal oob error: %w", err)
-		}
-		log.Printf("🔍 Received oob_include with URL: %s", oob.URL)
-		if err := c.processBacklog(oob.URL); err != nil {
-			log.Printf("⚠️ Error processing backlog: %v", err)
-		}
+		log.Printf("🔍 Received oob_include with URL: %s", ircMsg.URL)
+		c.startBacklog(ircMsg.URL)
 		return nil
 	}
 
 	// Accept message if not ignored and either no channels specified (accept all) or channel is in allowed list
 	if ircMsg.Type == "buffer_msg" && !c.ignoredChannelSet[ircMsg.Chan] && (len(c.channels) == 0 || c.channelSet[ircMsg.Chan]) {
-		// Check if we've seen this EID before (skip if duplicate)
-		if c.isEIDSeen(ircMsg.EID) {
-			if os.Getenv("IRCCLOUD_DEBUG") == "true" {
-				log.Printf("🔄 Duplicate message filtered: EID=%d, Channel=%s", ircMsg.EID, ircMsg.Chan)
-			}
-			return nil
-		}
-
 		cleanedMsg := utils.CleanIRCMessage(ircMsg.Msg)
 
 		// Handle timestamp conversion - IRCCloud uses microseconds since Unix epoch
@@ -195,8 +181,6 @@ func (c *IRCCloudClient) processMessage(message []byte) error {
 			log.Printf("🔍 Processing message: Channel=%s, From=%s, EID=%d, Time=%d, Converted=%s", ircMsg.Chan, ircMsg.From, ircMsg.EID, ircMsg.Time, msgTime.Format(time.RFC3339))
 		}
 
-		log.Printf("%s <%s> %s", ircMsg.Chan, ircMsg.From, cleanedMsg)
-
 		dbMsg := &storage.Message{
 			Channel:   ircMsg.Chan,
 			Timestamp: msgTime,
@@ -206,10 +190,20 @@ func (c *IRCCloudClient) processMessage(message []byte) error {
 			EID:       ircMsg.EID,
 		}
 
-		if err := c.db.InsertMessage(dbMsg); err != nil {
+		// Skip duplicates; the EID is only remembered once the insert succeeds
+		stored, err := c.storeMessage(dbMsg)
+		if err != nil {
 			log.Printf("❌ Error inserting message into DB: %v", err)
 			return fmt.Errorf("error inserting message into DB: %w", err)
 		}
+		if !stored {
+			if os.Getenv("IRCCLOUD_DEBUG") == "true" {
+				log.Printf("🔄 Duplicate message filtered: EID=%d, Channel=%s", ircMsg.EID, ircMsg.Chan)
+			}
+			return nil
+		}
+
+		log.Printf("%s <%s> %s", ircMsg.Chan, ircMsg.From, cleanedMsg)
 
 		if os.Getenv("IRCCLOUD_DEBUG") == "true" {
 			log.Printf("✅ Message stored successfully: EID=%d", ircMsg.EID)
@@ -1,11 +1,15 @@
 package api
 
 import (
+	"context"
 	"encoding/json"
+	"fmt"
+	"net"
 	"net/http"
 	"net/http/httptest"
 	"os"
 	"strings"
+	"sync/atomic"
 	"testing"
 	"time"
 
@@ -49,16 +53,9 @@ func TestFormtokenRequest(t *testing.T) {
 	}))
 	defer server.Close()
 
-	// This test would require refactoring authenticate to be testable
-	// For now, we test the response parsing logic
-	var tokenResp struct {
-		Success bool   `json:"success"`
-		Token   string `json:"token"`
-	}
-
-	err := json.Unmarshal([]byte(sampleTokenResponse), &tokenResp)
+	tokenResp, err := requestFormToken(server.Client(), server.URL+"/chat/auth-formtoken")
 	if err != nil {
-		t.Fatalf("Failed to parse token response: %v", err)
+		t.Fatalf("Failed to request token: %v", err)
 	}
 
 	if !tokenResp.Success {
@@ -143,6 +140,30 @@ func TestWebSocketURLBuilding(t *testing.T) {
 			},
 			expected: "wss://api-5.irccloud.com/websocket/5?since_id=0&stream_id=0",
 		},
+		{
+			name: "path with query is merged",
+			response: AuthResponse{
+				WebSocketHost: "api-2.irccloud.com",
+				WebSocketPath: "/websocket/2?x=1",
+			},
+			expected: "wss://api-2.irccloud.com/websocket/2?since_id=0&stream_id=0&x=1",
+		},
+		{
+			name: "escaped path is kept",
+			response: AuthResponse{
+				WebSocketHost: "api-2.irccloud.com",
+				WebSocketPath: "/websocket/a%20b",
+			},
+			expected: "wss://api-2.irccloud.com/websocket/a%20b?since_id=0&stream_id=0",
+		},
+		{
+			name: "invalid path uses fallback",
+			response: AuthResponse{
+				WebSocketHost: "api-2.irccloud.com",
+				WebSocketPath: "/websocket/%zz",
+			},
+			expected: "wss://www.irccloud.com/?since_id=0&stream_id=0",
+		},
 		{
 			name:     "empty response uses fallback",
 			response: AuthResponse{},
@@ -617,3 +638,311 @@ func TestMessageProcessingWithDuplicateEIDs(t *testing.T) {
 		t.Errorf("Expected EID 1234567890, got %d", messages[0].EID)
 	}
 }
+
+// Test backlog fetching through the shared HTTP client
+func TestProcessBacklog(t *testing.T) {
+	requests := 0
+	server := httptest.NewUnstartedServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		requests++
+		if r.Header.Get("Cookie") != "session=test-session" {
+			t.Errorf("Expected session cookie, got %s", r.Header.Get("Cookie"))
+		}
+		w.Header().Set("Content-Type", "application/json")
+		_, _ = w.Write([]byte(`[
+			{"type": "buffer_msg", "chan": "#test", "from": "user1", "msg": "First backlog message", "time": 1634567890000000, "eid": 1},
+			{"type": "buffer_msg", "chan": "#ignored", "from": "user2", "msg": "Ignored channel", "time": 1634567890000000, "eid": 2},
+			{"type": "joined_channel", "chan": "#test", "eid": 3},
+			{"type": "buffer_msg", "chan": "#test", "from": "user2", "msg": "Second backlog message", "time": 1634567891000000, "eid": 4}
+		]`))
+	}))
+	var newConns atomic.Int32
+	server.Config.ConnState = func(_ net.Conn, state http.ConnState) {
+		if state == http.StateNew {
+			newConns.Add(1)
+		}
+	}
+	server.Start()
+	defer server.Close()
+
+	db, err := storage.NewDB(":memory:")
+	if err != nil {
+		t.Fatalf("Failed to create test database: %v", err)
+	}
+	defer db.Close()
+
+	client := NewIRCCloudClient(db)
+	client.ignoredChannelSet = map[string]bool{"#ignored": true}
+
+	for i := 0; i < 2; i++ {
+		if backlogErr := client.processBacklog(context.Background(), "/chat/backlog", "test-session", server.URL); backlogErr != nil {
+			t.Fatalf("Failed to process backlog: %v", backlogErr)
+		}
+	}
+
+	if requests != 2 {
+		t.Errorf("Expected 2 backlog requests, got %d", requests)
+	}
+
+	if n := newConns.Load(); n != 1 {
+		t.Errorf("Expected backlog requests to share 1 connection, got %d", n)
+	}
+
+	messages, err := db.GetMessagesByDate("2021-10-18")
+	if err != nil {
+		t.Fatalf("Failed to retrieve messages: %v", err)
+	}
+
+	if len(messages) != 2 {
+		t.Errorf("Expected 2 backlog messages in database, got %d", len(messages))
+	}
+}
+
+// Test that a non-array backlog response is rejected
+func TestProcessBacklogInvalidResponse(t *testing.T) {
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Type", "application/json")
+		_, _ = w.Write([]byte(sampleErrorResponse))
+	}))
+	defer server.Close()
+
+	client := NewIRCCloudClient(nil)
+
+	if err := client.processBacklog(context.Background(), "/chat/backlog", "", server.URL); err == nil {
+		t.Error("Expected error when backlog response is not a JSON array")
+	}
+}
+
+// Test that slow inserts don't cut a backlog short once it is streaming
+func TestProcessBacklogSlowInserts(t *testing.T) {
+	const backlogCount = 20
+
+	release := make(chan struct{})
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Type", "application/json")
+		_, _ = w.Write([]byte("["))
+		for i := 1; i <= backlogCount; i++ {
+			if i > 1 {
+				_, _ = w.Write([]byte(","))
+			}
+			fmt.Fprintf(w, `{"type": "buffer_msg", "chan": "#test", "from": "backlog", "msg": "Backlog %d", "time": 1634567890000000, "eid": %d}`, i, i)
+
+			// Send the second half only after the stalled inserts resume
+			if i == backlogCount/2 {
+				w.(http.Flusher).Flush()
+				select {
+				case <-release:
+				case <-time.After(5 * time.Second):
+				}
+			}
+		}
+		_, _ = w.Write([]byte("]"))
+	}))
+	defer server.Close()
+
+	db, err := storage.NewDB(":memory:")
+	if err != nil {
+		t.Fatalf("Failed to create test database: %v", err)
+	}
+	defer db.Close()
+
+	client := NewIRCCloudClient(db)
+	client.backlogTimeout = 100 * time.Millisecond
+
+	// Hold the store lock so inserts take several backlog timeouts
+	client.storeMutex.Lock()
+	done := make(chan error, 1)
+	go func() {
+		done <- client.processBacklog(context.Background(), "/chat/backlog", "test-session", server.URL)
+	}()
+	time.Sleep(5 * client.backlogTimeout)
+	client.storeMutex.Unlock()
+	close(release)
+
+	if backlogErr := <-done; backlogErr != nil {
+		t.Fatalf("Failed to process backlog: %v", backlogErr)
+	}
+
+	messages, err := db.GetMessagesByDate("2021-10-18")
+	if err != nil {
+		t.Fatalf("Failed to retrieve messages: %v", err)
+	}
+
+	if len(messages) != backlogCount {
+		t.Errorf("Expected %d backlog messages in database, got %d", backlogCount, len(messages))
+	}
+}
+
+// Test that a server that stops sending fails the backlog instead of hanging
+func TestProcessBacklogStalled(t *testing.T) {
+	tests := []struct {
+		name        string
+		sendHeaders bool
+	}{
+		{"stalled response", false},
+		{"stalled body", true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+				if tt.sendHeaders {
+					w.Header().Set("Content-Type", "application/json")
+					_, _ = w.Write([]byte("["))
+					w.(http.Flusher).Flush()
+				}
+				select {
+				case <-r.Context().Done():
+				case <-time.After(5 * time.Second):
+				}
+			}))
+			defer server.Close()
+
+			client := NewIRCCloudClient(nil)
+			client.backlogTimeout = 50 * time.Millisecond
+
+			if err := client.processBacklog(context.Background(), "/chat/backlog", "", server.URL); err == nil {
+				t.Error("Expected error when the backlog server stalls")
+			}
+		})
+	}
+}
+
+// Test that a backlog fetched in the background and live messages are all stored
+func TestBacklogWithConcurrentLiveMessages(t *testing.T) {
+	const backlogCount = 50
+	const liveCount = 50
+
+	liveSent := make(chan struct{})
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Type", "application/json")
+		_, _ = w.Write([]byte("["))
+		for i := 1; i <= backlogCount; i++ {
+			if i > 1 {
+				_, _ = w.Write([]byte(","))
+			}
+			fmt.Fprintf(w, `{"type": "buffer_msg", "chan": "#test", "from": "backlog", "msg": "Backlog %d", "time": 1634567890000000, "eid": %d}`, i, i)
+			w.(http.Flusher).Flush()
+
+			// Hold the second half back until the live messages are in flight
+			if i == backlogCount/2 {
+				select {
+				case <-liveSent:
+				case <-time.After(5 * time.Second):
+				}
+			}
+		}
+		_, _ = w.Write([]byte("]"))
+	}))
+	defer server.Close()
+
+	db, err := storage.NewDB(":memory:")
+	if err != nil {
+		t.Fatalf("Failed to create test database: %v", err)
+	}
+	defer db.Close()
+
+	client := NewIRCCloudClient(db)
+	client.setSession("test-session", server.URL)
+
+	if processErr := client.processMessage([]byte(`{"type": "oob_include", "url": "/chat/backlog"}`)); processErr != nil {
+		t.Fatalf("Failed to process oob_include: %v", processErr)
+	}
+
+	for i := 1; i <= liveCount; i++ {
+		eid := backlogCount + i
+		message := fmt.Sprintf(`{"type": "buffer_msg", "chan": "#test", "from": "live", "msg": "Live %d", "time": 1634567890000000, "eid": %d}`, i, eid)
+		if processErr := client.processMessage([]byte(message)); processErr != nil {
+			t.Errorf("Failed to process live message %d: %v", eid, processErr)
+		}
+		if i == liveCount/2 {
+			close(liveSent)
+		}
+	}
+
+	client.backlogWG.Wait()
+
+	messages, err := db.GetMessagesByDate("2021-10-18")
+	if err != nil {
+		t.Fatalf("Failed to retrieve messages: %v", err)
+	}
+
+	if len(messages) != backlogCount+liveCount {
+		t.Errorf("Expected %d messages in database, got %d", backlogCount+liveCount, len(messages))
+	}
+}
+
+// Test that no backlog fetch starts once Close has begun
+func TestStartBacklogAfterClose(t *testing.T) {
+	requests := 0
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		requests++
+		_, _ = w.Write([]byte("[]"))
+	}))
+	defer server.Close()
+
+	client := NewIRCCloudClient(nil)
+	client.setSession("test-session", server.URL)
+	client.Close()
+
+	client.startBacklog("/chat/backlog")
+	client.backlogWG.Wait()
+
+	if requests != 0 {
+		t.Errorf("Expected no backlog requests after Close, got %d", requests)
+	}
+}
+
+// Test that a failed insert does not mark the EID as seen
+func TestStoreMessageFailureAllowsRetry(t *testing.T) {
+	db, err := storage.NewDB(":memory:")
+	if err != nil {
+		t.Fatalf("Failed to create test database: %v", err)
+	}
+	defer db.Close()
+
+	client := NewIRCCloudClient(db)
+	message := `{"type": "buffer_msg", "chan": "#test", "from": "testuser", "msg": "Hello", "time": 1634567890000000, "eid": 42}`
+
+	// Point the client at a closed database so the insert fails
+	closedDB, err := storage.NewDB(":memory:")
+	if err != nil {
+		t.Fatalf("Failed to create test database: %v", err)
+	}
+	closedDB.Close()
+	client.db = closedDB
+
+	if processErr := client.processMessage([]byte(message)); processErr == nil {
+		t.Fatal("Expected error when inserting into a closed database")
+	}
+
+	client.db = db
+	if processErr := client.processMessage([]byte(message)); processErr != nil {
+		t.Fatalf("Failed to process retried message: %v", processErr)
+	}
+
+	messages, err := db.GetMessagesByDate("2021-10-18")
+	if err != nil {
+		t.Fatalf("Failed to retrieve messages: %v", err)
+	}
+
+	if len(messages) != 1 {
+		t.Errorf("Expected retried message to be stored, got %d messages", len(messages))
+	}
+}
+
+// Test that the WebSocket dialer is built once and reused across attempts
+func TestWebSocketDialerReuse(t *testing.T) {
+	client := NewIRCCloudClient(nil)
+	client.SetConnectionConfig(&config.ConnectionConfig{
+		ConnectionTimeout: "10s",
+	})
+
+	dialer := client.webSocketDialer()
+	if dialer.HandshakeTimeout != 10*time.Second {
+		t.Errorf("Expected handshake timeout 10s, got %v", dialer.HandshakeTimeout)
+	}
+
+	if client.webSocketDialer() != dialer {
+		t.Error("Expected the same dialer to be reused across connection attempts")
+	}
+}
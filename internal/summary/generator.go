@@ -15,6 +15,35 @@ import (
 	"irccloud-watcher/internal/storage"
 )
 
+var (
+	// Patterns for noise filtering. Join/part/quit, mode changes and nick
+	// changes are always dropped, so they share a single alternation and each
+	// message is scanned once instead of three times.
+	statusChangeRegex = regexp.MustCompile(`^(-->|<--|\*{3})\s*.*?\s+(has joined|has left|has quit|joined|left|quit|sets mode|was kicked|was banned|is now known as)`)
+	topicChangeRegex  = regexp.MustCompile(`^(-->|<--|\*{3})\s*.*?\s+(changed the topic|set the topic)`)
+
+	// Common bot name prefixes, matched case-insensitively against the sender
+	botPrefixes = []string{"bot", "github", "travis", "ci", "deploy", "monitor", "alert", "status", "feed", "rss"}
+
+	// Common stop words ignored during topic extraction
+	stopWords = map[string]bool{
+		"the": true, "and": true, "for": true, "are": true, "but": true, "not": true,
+		"you": true, "all": true, "can": true, "had": true, "her": true, "was": true,
+		"one": true, "our": true, "out": true, "day": true, "get": true, "has": true,
+		"him": true, "how": true, "its": true, "may": true, "new": true, "now": true,
+		"old": true, "see": true, "two": true, "who": true, "boy": true, "did": true,
+		"she": true, "use": true, "way": true, "oil": true, "sit": true, "set": true,
+		"say": true, "run": true, "eat": true, "far": true, "sea": true, "eye": true,
+		"ask": true, "own": true, "under": true, "think": true, "also": true, "back": true,
+		"after": true, "first": true, "well": true, "year": true, "work": true, "such": true,
+		"make": true, "even": true, "here": true, "good": true, "this": true, "that": true,
+		"with": true, "have": true, "from": true, "they": true, "know": true, "want": true,
+		"been": true, "much": true, "some": true, "time": true, "very": true, "when": true,
+		"come": true, "just": true, "like": true, "long": true, "many": true, "over": true,
+		"take": true, "than": true, "them": true, "were": true, "will": true,
+	}
+)
+
 // Generator generates daily summaries of IRC messages with LLM support.
 type Generator struct {
 	config   *config.Config
@@ -72,6 +101,9 @@ func (g *Generator) initializeLLMProvider() {
 
 // GenerateDailySummary generates a summary of messages from the last 24 hours.
 func (g *Generator) GenerateDailySummary(db *storage.DB, outputPath string) error {
+	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Minute)
+	defer cancel()
+
 	endTime := time.Now()
 	startTime := endTime.Add(-24 * time.Hour)
 
@@ -85,6 +117,16 @@ func (g *Generator) GenerateDailySummary(db *storage.DB, outputPath string) erro
 		return nil
 	}
 
+	// Check LLM provider health in the background while messages are
+	// preprocessed, instead of waiting for the round-trip afterwards
+	var healthCheck chan error
+	if g.provider != nil {
+		healthCheck = make(chan error, 1)
+		go func() {
+			healthCheck <- g.provider.Health(ctx)
+		}()
+	}
+
 	// Preprocess messages
 	filteredMessages := g.filterMessages(messages)
 	groupedMessages := g.groupMessages(filteredMessages)
@@ -93,10 +135,7 @@ func (g *Generator) GenerateDailySummary(db *storage.DB, outputPath string) erro
 
 	// Try LLM generation first, fall back to basic formatting
 	if g.provider != nil {
-		ctx, cancel := context.WithTimeout(context.Background(), 5*time.Minute)
-		defer cancel()
-
-		llmSummary, llmErr := g.generateLLMSummary(ctx, groupedMessages)
+		llmSummary, llmErr := g.generateLLMSummary(ctx, healthCheck, groupedMessages)
 		if llmErr != nil {
 			log.Printf("⚠️ LLM summary generation failed: %v, falling back to basic formatting", llmErr)
 			summary = g.formatSummary(filteredMessages)
@@ -120,58 +159,25 @@ func (g *Generator) GenerateDailySummary(db *storage.DB, outputPath string) erro
 func (g *Generator) filterMessages(messages []storage.Message) []storage.Message {
 	var filtered []storage.Message
 
-	// Patterns for noise filtering
-	joinPartRegex := regexp.MustCompile(`^(-->|<--|\*{3})\s*(.*?)\s+(has joined|has left|has quit|joined|left|quit)`)
-	modeChangeRegex := regexp.MustCompile(`^(-->|<--|\*{3})\s*.*?\s+(sets mode|was kicked|was banned)`)
-	nickChangeRegex := regexp.MustCompile(`^(-->|<--|\*{3})\s*.*?\s+is now known as`)
-	topicChangeRegex := regexp.MustCompile(`^(-->|<--|\*{3})\s*.*?\s+(changed the topic|set the topic)`)
-
-	// Bot patterns (common bot names and patterns)
-	botPatterns := []*regexp.Regexp{
-		regexp.MustCompile(`(?i)^(bot|github|travis|ci|deploy|monitor|alert|status|feed|rss)`),
-		regexp.MustCompile(`(?i)bot$`),
-	}
-
 	for _, msg := range messages {
-		// Skip empty messages
-		if strings.TrimSpace(msg.Message) == "" {
-			continue
-		}
-
-		// Skip join/part/quit messages
-		if joinPartRegex.MatchString(msg.Message) {
+		// Cheap checks run first so the regexes only see candidate messages.
+		// Skip empty and very short messages (likely not meaningful)
+		if len(strings.TrimSpace(msg.Message)) < 10 {
 			continue
 		}
 
-		// Skip mode changes
-		if modeChangeRegex.MatchString(msg.Message) {
+		// Skip likely bot messages
+		if isBotSender(msg.Sender) {
 			continue
 		}
 
-		// Skip nick changes
-		if nickChangeRegex.MatchString(msg.Message) {
+		// Skip join/part/quit messages, mode changes and nick changes
+		if statusChangeRegex.MatchString(msg.Message) {
 			continue
 		}
 
 		// Skip topic changes (unless it's substantial)
-		if topicChangeRegex.MatchString(msg.Message) && len(msg.Message) < 100 {
-			continue
-		}
-
-		// Skip likely bot messages
-		isBot := false
-		for _, pattern := range botPatterns {
-			if pattern.MatchString(msg.Sender) {
-				isBot = true
-				break
-			}
-		}
-		if isBot {
-			continue
-		}
-
-		// Skip very short messages (likely not meaningful)
-		if len(strings.TrimSpace(msg.Message)) < 10 {
+		if len(msg.Message) < 100 && topicChangeRegex.MatchString(msg.Message) {
 			continue
 		}
 
@@ -181,6 +187,20 @@ func (g *Generator) filterMessages(messages []storage.Message) []storage.Message
 	return filtered
 }
 
+// isBotSender checks if a sender name looks like a bot.
+func isBotSender(sender string) bool {
+	name := strings.ToLower(sender)
+	if strings.HasSuffix(name, "bot") {
+		return true
+	}
+	for _, prefix := range botPrefixes {
+		if strings.HasPrefix(name, prefix) {
+			return true
+		}
+	}
+	return false
+}
+
 // groupMessages groups messages by channel and conversation topics.
 func (g *Generator) groupMessages(messages []storage.Message) []MessageGroup {
 	// Group by channel first
@@ -259,7 +279,7 @@ func (g *Generator) extractTopic(messages []storage.Message) string {
 		words := strings.Fields(strings.ToLower(msg.Message))
 		for _, word := range words {
 			// Clean word of punctuation
-			word = regexp.MustCompile(`\W`).ReplaceAllString(word, "")
+			word = stripNonWord(word)
 			if len(word) > 3 && !isStopWord(word) {
 				wordCount[word]++
 				totalWords++
@@ -295,36 +315,39 @@ func (g *Generator) extractTopic(messages []storage.Message) string {
 	return "General Discussion"
 }
 
+// stripNonWord removes every character outside [0-9A-Za-z_], matching the
+// regexp \W class without running a regex per word.
+func stripNonWord(word string) string {
+	return strings.Map(func(r rune) rune {
+		if r == '_' || (r >= '0' && r <= '9') || (r >= 'a' && r <= 'z') || (r >= 'A' && r <= 'Z') {
+			return r
+		}
+		return -1
+	}, word)
+}
+
 // isStopWord checks if a word is a common stop word.
 func isStopWord(word string) bool {
-	stopWords := map[string]bool{
-		"the": true, "and": true, "for": true, "are": true, "but": true, "not": true,
-		"you": true, "all": true, "can": true, "had": true, "her": true, "was": true,
-		"one": true, "our": true, "out": true, "day": true, "get": true, "has": true,
-		"him": true, "how": true, "its": true, "may": true, "new": true, "now": true,
-		"old": true, "see": true, "two": true, "who": true, "boy": true, "did": true,
-		"she": true, "use": true, "way": true, "oil": true, "sit": true, "set": true,
-		"say": true, "run": true, "eat": true, "far": true, "sea": true, "eye": true,
-		"ask": true, "own": true, "under": true, "think": true, "also": true, "back": true,
-		"after": true, "first": true, "well": true, "year": true, "work": true, "such": true,
-		"make": true, "even": true, "here": true, "good": true, "this": true, "that": true,
-		"with": true, "have": true, "from": true, "they": true, "know": true, "want": true,
-		"been": true, "much": true, "some": true, "time": true, "very": true, "when": true,
-		"come": true, "just": true, "like": true, "long": true, "many": true, "over": true,
-		"take": true, "than": true, "them": true, "were": true, "will": true,
-	}
 	return stopWords[word]
 }
 
 // generateLLMSummary generates a summary using the configured LLM provider.
-func (g *Generator) generateLLMSummary(ctx context.Context, groups []MessageGroup) (string, error) {
+// healthCheck delivers the result of a provider health check started by the
+// caller; when it is nil the health check runs here instead.
+func (g *Generator) generateLLMSummary(ctx context.Context, healthCheck <-chan error, groups []MessageGroup) (string, error) {
 	if g.provider == nil {
 		return "", fmt.Errorf("no LLM provider configured")
 	}
 
-	// Check provider health first
-	if err := g.provider.Health(ctx); err != nil {
-		return "", fmt.Errorf("LLM provider health check failed: %w", err)
+	// Wait for the provider health check before generating
+	var healthErr error
+	if healthCheck != nil {
+		healthErr = <-healthCheck
+	} else {
+		healthErr = g.provider.Health(ctx)
+	}
+	if healthErr != nil {
+		return "", fmt.Errorf("LLM provider health check failed: %w", healthErr)
 	}
 
 	template := g.getPromptTemplate()
@@ -343,11 +366,12 @@ func (g *Generator) generateLLMSummary(ctx context.Context, groups []MessageGrou
 	}
 
 	// Add metadata
-	summary := fmt.Sprintf("# Daily IRC Summary - %s\n\n", time.Now().Format("January 2, 2006"))
-	summary += fmt.Sprintf("*Generated using %s (%s) - %d tokens*\n\n", g.provider.Name(), resp.Model, resp.TokensUsed)
-	summary += resp.Text
+	var summary strings.Builder
+	fmt.Fprintf(&summary, "# Daily IRC Summary - %s\n\n", time.Now().Format("January 2, 2006"))
+	fmt.Fprintf(&summary, "*Generated using %s (%s) - %d tokens*\n\n", g.provider.Name(), resp.Model, resp.TokensUsed)
+	summary.WriteString(resp.Text)
 
-	return summary, nil
+	return summary.String(), nil
 }
 
 // getPromptTemplate returns the prompt template for summary generation.
@@ -390,13 +414,13 @@ func (g *Generator) buildPrompt(template Template, groups []MessageGroup) string
 			continue
 		}
 
-		conversationText.WriteString(fmt.Sprintf("\n## %s - %s\n", group.Channel, group.Topic))
-		conversationText.WriteString(fmt.Sprintf("*Time: %s to %s*\n\n",
-			group.StartTime.Format("15:04"), group.EndTime.Format("15:04")))
+		fmt.Fprintf(&conversationText, "\n## %s - %s\n", group.Channel, group.Topic)
+		fmt.Fprintf(&conversationText, "*Time: %s to %s*\n\n",
+			group.StartTime.Format("15:04"), group.EndTime.Format("15:04"))
 
 		for _, msg := range group.Messages {
-			conversationText.WriteString(fmt.Sprintf("[%s] <%s> %s\n",
-				msg.Timestamp.Format("15:04"), msg.Sender, strings.TrimSpace(msg.Message)))
+			fmt.Fprintf(&conversationText, "[%s] <%s> %s\n",
+				msg.Timestamp.Format("15:04"), msg.Sender, strings.TrimSpace(msg.Message))
 		}
 		conversationText.WriteString("\n")
 	}
@@ -410,7 +434,7 @@ func (g *Generator) buildPrompt(template Template, groups []MessageGroup) string
 func (g *Generator) formatSummary(messages []storage.Message) string {
 	var sb strings.Builder
 
-	sb.WriteString(fmt.Sprintf("# Daily IRC Summary - %s\n\n", time.Now().Format("January 2, 2006")))
+	fmt.Fprintf(&sb, "# Daily IRC Summary - %s\n\n", time.Now().Format("January 2, 2006"))
 	sb.WriteString("*Generated using basic text formatting*\n\n")
 
 	// Group messages by channel
@@ -420,9 +444,9 @@ func (g *Generator) formatSummary(messages []storage.Message) string {
 	}
 
 	for channel, msgs := range messagesByChannel {
-		sb.WriteString(fmt.Sprintf("## Summary for %s\n\n", channel))
+		fmt.Fprintf(&sb, "## Summary for %s\n\n", channel)
 		for _, msg := range msgs {
-			sb.WriteString(fmt.Sprintf("[%s] <%s> %s\n", msg.Timestamp.Format("15:04"), msg.Sender, msg.Message))
+			fmt.Fprintf(&sb, "[%s] <%s> %s\n", msg.Timestamp.Format("15:04"), msg.Sender, msg.Message)
 		}
 		sb.WriteString("\n")
 	}
@@ -12,8 +12,15 @@ var (
 	ircColorRegex = regexp.MustCompile(`\x03(?:\d{1,2}(?:,\d{1,2})?)?|\x02|\x1F|\x1D|\x1E|\x0F`)
 )
 
+// ircControlChars are the bytes that can start a match of ircColorRegex
+const ircControlChars = "\x02\x03\x0F\x1D\x1E\x1F"
+
 // RemoveIRCColors removes IRC color and formatting control codes from a message
 func RemoveIRCColors(message string) string {
+	// Most messages carry no formatting; skip the regex pass entirely for those
+	if !strings.ContainsAny(message, ircControlChars) {
+		return message
+	}
 	return ircColorRegex.ReplaceAllString(message, "")
 }
 